@@ -5,13 +5,111 @@ Validates that notebooks are correctly deployed to the Databricks workspace
 """
 
 import sys
-import json
+import time
+import random
 import argparse
-import requests
-from typing import List, Dict, Optional
+import asyncio
+import threading
+import concurrent.futures
+from collections import Counter, deque
+import httpx
+import orjson
+from typing import List, Dict, Optional, Tuple, Union
 import os
 from datetime import datetime
 
+# Rate limited / transient server errors that are worth retrying
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Transport failures the Databricks SDK also retries; config and protocol errors fail immediately
+TRANSIENT_TRANSPORT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+class _NotFound:
+    """Falsy marker for API responses that returned 404"""
+    
+    def __bool__(self):
+        return False
+
+
+# Returned by the request helpers instead of None when the resource does not exist
+NOT_FOUND = _NotFound()
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by the sync client and every traversal event loop"""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize the bucket full
+        
+        Args:
+            capacity: Maximum burst size in requests
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """
+        Take a token, going into debt if the bucket is empty
+        
+        Returns:
+            Seconds the caller must wait before the reserved token is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_rate
+    
+    def acquire(self):
+        """Block until a request may be issued"""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be issued"""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def _classify_objects(objects: List[Dict]) -> Tuple[List[str], List[str]]:
+    """
+    Split workspace list objects into notebook and directory paths
+    
+    Kept free of instance state and fully annotated so it can be compiled with mypyc
+    
+    Args:
+        objects: Objects returned by /workspace/list
+        
+    Returns:
+        Tuple of (notebook paths, directory paths)
+    """
+    notebook_paths: List[str] = []
+    dir_paths: List[str] = []
+    # Bind hot-loop methods locally to skip attribute lookups per listed object
+    notebooks_append = notebook_paths.append
+    dirs_append = dir_paths.append
+    
+    for obj in objects:
+        obj_path = obj['path']
+        object_type = obj['object_type']
+        if object_type == 'NOTEBOOK':
+            notebooks_append(obj_path)
+        elif object_type == 'DIRECTORY':
+            dirs_append(obj_path)
+    
+    return notebook_paths, dir_paths
+
 
 class DeploymentValidator:
     """Validates Databricks deployments"""
@@ -33,10 +131,102 @@ class DeploymentValidator:
             'Content-Type': 'application/json'
         }
         # All environments now use standard shared paths with bundle structure
-        self.base_path = f"/Workspace/Deployments/{env}/files/src"
-        self.validation_results = []
+        self.bundle_root = f"/Workspace/Deployments/{env}"
+        self.base_path = f"{self.bundle_root}/files/src"
+        self.validation_results: List[Dict] = []
+        # Cluster name -> cluster info, fetched once on first cluster check
+        self._clusters_by_name: Optional[Dict[str, Dict]] = None
+        
+        # Sync client for the smoke test and cluster listing; they run one at a time, so one kept-alive
+        # connection is enough. Folder listings use their own async client (see _list_notebooks_async)
+        self.client = httpx.Client(base_url=self.host, headers=self.headers, http2=True, timeout=30.0,
+                                   limits=httpx.Limits(max_connections=1, max_keepalive_connections=1))
+        # Maximum number of directories listed concurrently during traversal
+        self.max_concurrency = 16
+        # Exponential backoff settings for rate limited / transient failures
+        self.max_retries = 5
+        self.base_delay = 1.0
+        self.max_delay = 30.0
+        # Stay under the ~10 req/s Workspace API limit instead of bursting into 429s
+        self.rate_limiter = TokenBucket(capacity=10, refill_rate=10.0)
+        
+    def close(self):
+        """Close the underlying HTTP client"""
+        self.client.close()
+        
+    def _record(self, passed: bool, result: Dict, output: List[str]) -> bool:
+        """
+        Record a check's result and write its console output in one call
+        
+        Checks run on worker threads but are recorded from the main thread in
+        submission order, so the report and console output are deterministic
+        
+        Args:
+            passed: Whether the check passed
+            result: Validation result entry for the report
+            output: Console lines produced by the check
+            
+        Returns:
+            passed, unchanged
+        """
+        self.validation_results.append(result)
+        sys.stdout.write("\n".join(output) + "\n")
+        return passed
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Compute how long to wait before retrying a request
         
-    def _make_request(self, endpoint: str, method: str = 'GET', data: Dict = None) -> Optional[Dict]:
+        Args:
+            attempt: Zero-based attempt number that just failed
+            retry_after: Value of the Retry-After response header, if any
+            
+        Returns:
+            Delay in seconds
+        """
+        if retry_after:
+            try:
+                # Honour the server's hint, but never stall the job longer than max_delay or sleep negative
+                return max(0.0, min(self.max_delay, float(retry_after)))
+            except ValueError:
+                pass
+        return min(self.max_delay, self.base_delay * 2 ** attempt) + random.uniform(0, 1)
+    
+    def _handle_attempt(self, attempt: int, response: Optional[httpx.Response] = None,
+                        error: Optional[Exception] = None) -> Tuple[Optional[float], Optional[Union[Dict, _NotFound]]]:
+        """
+        Decide the outcome of one request attempt for both the sync and async request paths
+        
+        Args:
+            attempt: Zero-based attempt number
+            response: Response received, if the request was sent
+            error: Exception raised while sending the request or decoding its response
+            
+        Returns:
+            Tuple of (seconds to wait before retrying, or None if the result is final;
+            response JSON, NOT_FOUND if the resource does not exist, or None if error)
+        """
+        can_retry = attempt < self.max_retries - 1
+        
+        if error is not None:
+            # Dropped connections and timeouts are transient; retry them like a 503
+            if isinstance(error, TRANSIENT_TRANSPORT_ERRORS) and can_retry:
+                return self._retry_delay(attempt), None
+            print(f"❌ Request error: {error}")
+            return None, None
+        
+        assert response is not None
+        if response.status_code == 200:
+            return None, orjson.loads(response.content)
+        if response.status_code == 404:
+            return None, NOT_FOUND
+        if response.status_code in RETRYABLE_STATUS_CODES and can_retry:
+            return self._retry_delay(attempt, response.headers.get('Retry-After')), None
+        print(f"❌ API request failed: {response.status_code} - {response.text}")
+        return None, None
+    
+    def _make_request(self, endpoint: str, method: str = 'GET',
+                      data: Optional[Dict] = None) -> Optional[Union[Dict, _NotFound]]:
         """
         Make API request to Databricks
         
@@ -46,174 +236,287 @@ class DeploymentValidator:
             data: Request data
             
         Returns:
-            Response JSON or None if error
+            Response JSON, NOT_FOUND if the resource does not exist, or None if error
         """
         # Ensure endpoint starts with /api/2.0 if not already
         if not endpoint.startswith('/api/2.0'):
             endpoint = f"/api/2.0{endpoint}"
-        url = f"{self.host}{endpoint}"
         
-        try:
-            if method == 'GET':
-                response = requests.get(url, headers=self.headers)
-            elif method == 'POST':
-                response = requests.post(url, headers=self.headers, json=data)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+        for attempt in range(self.max_retries):
+            self.rate_limiter.acquire()
+            try:
+                if method == 'GET':
+                    response = self.client.get(endpoint)
+                elif method == 'POST':
+                    response = self.client.post(endpoint, json=data)
+                else:
+                    raise ValueError(f"Unsupported method: {method}")
+                delay, result = self._handle_attempt(attempt, response=response)
+            except Exception as e:
+                delay, result = self._handle_attempt(attempt, error=e)
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"❌ API request failed: {response.status_code} - {response.text}")
-                return None
-        except Exception as e:
-            print(f"❌ Request error: {e}")
-            return None
+            if delay is None:
+                return result
+            time.sleep(delay)
+        return None
     
-    def check_path_exists(self, path: str) -> bool:
+    async def _post_async(self, client: httpx.AsyncClient, endpoint: str,
+                          data: Dict) -> Optional[Union[Dict, _NotFound]]:
         """
-        Check if a path exists in the workspace
+        Make async POST request to Databricks
         
         Args:
-            path: Workspace path to check
+            client: Open async HTTP client
+            endpoint: API endpoint
+            data: Request data
             
         Returns:
-            True if path exists, False otherwise
+            Response JSON, NOT_FOUND if the resource does not exist, or None if error
         """
-        # Use GET with path as query parameter
-        endpoint = f'/workspace/get-status?path={path}'
-        response = self._make_request(endpoint, 'GET')
+        if not endpoint.startswith('/api/2.0'):
+            endpoint = f"/api/2.0{endpoint}"
         
-        if response and 'path' in response:
-            return True
-        return False
+        for attempt in range(self.max_retries):
+            await self.rate_limiter.acquire_async()
+            try:
+                response = await client.post(endpoint, json=data)
+                delay, result = self._handle_attempt(attempt, response=response)
+            except Exception as e:
+                delay, result = self._handle_attempt(attempt, error=e)
+            
+            if delay is None:
+                return result
+            await asyncio.sleep(delay)
+        return None
     
-    def list_notebooks(self, path: str) -> List[str]:
+    async def _list_notebooks_async(self, path: str) -> Optional[Union[List[str], _NotFound]]:
         """
-        List notebooks in a directory
+        Walk the tree under a directory breadth-first, listing a batch of directories at a time
         
         Args:
             path: Directory path
             
         Returns:
-            List of notebook paths
+            List of notebook paths, NOT_FOUND if the directory does not exist, or None if it cannot be listed
         """
-        data = {'path': path}
-        response = self._make_request('/workspace/list', 'POST', data)
-        
-        notebooks = []
-        if response and 'objects' in response:
-            for obj in response['objects']:
-                if obj.get('object_type') == 'NOTEBOOK':
-                    notebooks.append(obj['path'])
-                elif obj.get('object_type') == 'DIRECTORY':
-                    # Recursively list notebooks in subdirectories
-                    sub_notebooks = self.list_notebooks(obj['path'])
-                    notebooks.extend(sub_notebooks)
+        notebooks: List[str] = []
+        pending = deque([path])
+        
+        # An AsyncClient is bound to the event loop it runs on and each worker thread runs its own loop,
+        # so every listing opens a fresh client and connection. HTTP/2 multiplexes a batch over that one
+        # connection; the pool allows one per batch request for servers that fall back to HTTP/1.1
+        async with httpx.AsyncClient(base_url=self.host, headers=self.headers, http2=True, timeout=30.0,
+                                     limits=httpx.Limits(max_connections=self.max_concurrency)) as client:
+            while pending:
+                batch = [pending.popleft() for _ in range(min(len(pending), self.max_concurrency))]
+                responses = await asyncio.gather(
+                    *[self._post_async(client, '/workspace/list', {'path': directory}) for directory in batch]
+                )
+                
+                for directory, response in zip(batch, responses):
+                    if response is None or isinstance(response, _NotFound):
+                        if directory == path:
+                            # The requested directory itself is missing or unreadable
+                            return response
+                        continue
+                    notebook_paths, dir_paths = _classify_objects(response.get('objects', []))
+                    notebooks.extend(notebook_paths)
+                    pending.extend(dir_paths)
         
         return notebooks
     
-    def validate_folder(self, folder_name: str) -> bool:
+    def list_notebooks(self, path: str) -> Optional[Union[List[str], _NotFound]]:
         """
-        Validate that a folder is deployed
+        List notebooks in a directory and all of its subdirectories
+        
+        Args:
+            path: Directory path
+            
+        Returns:
+            List of notebook paths, NOT_FOUND if the directory does not exist, or None if it cannot be listed
+        """
+        return asyncio.run(self._list_notebooks_async(path))
+    
+    def _check_folder(self, folder_name: str) -> Tuple[bool, Dict, List[str]]:
+        """
+        Check that a folder is deployed without recording the result
         
         Args:
             folder_name: Name of the folder to validate
             
         Returns:
-            True if validation passes
+            Tuple of (passed, validation result, console lines)
         """
-        print(f"\n📁 Validating {folder_name} folder deployment...")
+        output = [f"\n📁 Validating {folder_name} folder deployment..."]
         
         folder_path = f"{self.base_path}/{folder_name}"
         
-        # Check if folder exists
-        if not self.check_path_exists(folder_path):
-            self.validation_results.append({
+        # List notebooks in folder; a missing folder fails the listing itself
+        notebooks = self.list_notebooks(folder_path)
+        
+        if isinstance(notebooks, _NotFound):
+            output.append(f"  ❌ {folder_name} folder not found at {folder_path}")
+            return False, {
                 'component': folder_name,
                 'status': 'FAILED',
                 'message': f'{folder_name} folder not found at {folder_path}'
-            })
-            print(f"  ❌ {folder_name} folder not found at {folder_path}")
-            return False
+            }, output
         
-        # List notebooks in folder
-        notebooks = self.list_notebooks(folder_path)
+        if notebooks is None:
+            # Auth failures and errors that outlast the retries; the API error was already printed
+            output.append(f"  ❌ {folder_name} folder could not be listed at {folder_path}")
+            return False, {
+                'component': folder_name,
+                'status': 'FAILED',
+                'message': f'{folder_name} folder could not be listed at {folder_path}'
+            }, output
         
         if not notebooks:
-            self.validation_results.append({
+            output.append(f"  ⚠️  {folder_name} folder exists but contains no notebooks")
+            return True, {
                 'component': folder_name,
                 'status': 'WARNING',
                 'message': f'{folder_name} folder exists but contains no notebooks'
-            })
-            print(f"  ⚠️  {folder_name} folder exists but contains no notebooks")
-            return True
+            }, output
         
-        self.validation_results.append({
+        output.append(f"  ✅ {folder_name} folder validated - {len(notebooks)} notebooks found")
+        output.extend(f"     - {notebook.rsplit('/', 1)[-1]}" for notebook in notebooks)
+        return True, {
             'component': folder_name,
             'status': 'PASSED',
             'message': f'Found {len(notebooks)} notebooks in {folder_name} folder',
             'notebooks': notebooks
-        })
-        
-        print(f"  ✅ {folder_name} folder validated - {len(notebooks)} notebooks found")
-        for notebook in notebooks:
-            print(f"     - {notebook.split('/')[-1]}")
+        }, output
+    
+    def validate_folder(self, folder_name: str) -> bool:
+        """
+        Validate that a folder is deployed
         
-        return True
+        Args:
+            folder_name: Name of the folder to validate
+            
+        Returns:
+            True if validation passes
+        """
+        return self._record(*self._check_folder(folder_name))
     
     def validate_shared_folder(self) -> bool:
         """Legacy method for backward compatibility"""
         return self.validate_folder('shared')
     
-    def validate_use_case(self, use_case: str) -> bool:
+    def _check_use_case(self, use_case: str) -> Tuple[bool, Dict, List[str]]:
         """
-        Validate that a use case is deployed
+        Check that a use case is deployed without recording the result
         
         Args:
             use_case: Use case/folder name
             
         Returns:
-            True if validation passes
+            Tuple of (passed, validation result, console lines)
         """
-        print(f"\n📁 Validating {use_case} deployment...")
+        output = [f"\n📁 Validating {use_case} deployment..."]
         
         use_case_path = f"{self.base_path}/{use_case}"
         
-        # Check if use case folder exists
-        if not self.check_path_exists(use_case_path):
-            self.validation_results.append({
+        # List notebooks in use case folder; a missing folder fails the listing itself
+        notebooks = self.list_notebooks(use_case_path)
+        
+        if isinstance(notebooks, _NotFound):
+            output.append(f"  ❌ {use_case} folder not found at {use_case_path}")
+            return False, {
                 'component': use_case,
                 'status': 'FAILED',
                 'message': f'{use_case} folder not found at {use_case_path}'
-            })
-            print(f"  ❌ {use_case} folder not found at {use_case_path}")
-            return False
+            }, output
         
-        # List notebooks in use case folder
-        notebooks = self.list_notebooks(use_case_path)
+        if notebooks is None:
+            # Auth failures and errors that outlast the retries; the API error was already printed
+            output.append(f"  ❌ {use_case} folder could not be listed at {use_case_path}")
+            return False, {
+                'component': use_case,
+                'status': 'FAILED',
+                'message': f'{use_case} folder could not be listed at {use_case_path}'
+            }, output
         
         if not notebooks:
-            self.validation_results.append({
+            output.append(f"  ⚠️  {use_case} folder exists but contains no notebooks")
+            return True, {
                 'component': use_case,
                 'status': 'WARNING',
                 'message': f'{use_case} folder exists but contains no notebooks'
-            })
-            print(f"  ⚠️  {use_case} folder exists but contains no notebooks")
-            return True
+            }, output
         
-        self.validation_results.append({
+        output.append(f"  ✅ {use_case} validated - {len(notebooks)} notebooks found")
+        output.extend(f"     - {notebook.rsplit('/', 1)[-1]}" for notebook in notebooks)
+        return True, {
             'component': use_case,
             'status': 'PASSED',
             'message': f'Found {len(notebooks)} notebooks in {use_case}',
             'notebooks': notebooks
-        })
+        }, output
+    
+    def validate_use_case(self, use_case: str) -> bool:
+        """
+        Validate that a use case is deployed
+        
+        Args:
+            use_case: Use case/folder name
+            
+        Returns:
+            True if validation passes
+        """
+        return self._record(*self._check_use_case(use_case))
+    
+    def _get_clusters_by_name(self) -> Dict[str, Dict]:
+        """
+        Get workspace clusters keyed by name, listing them only once
         
-        print(f"  ✅ {use_case} validated - {len(notebooks)} notebooks found")
-        for notebook in notebooks:
-            print(f"     - {notebook.split('/')[-1]}")
+        Returns:
+            Dictionary of cluster name to cluster info
+        """
+        if self._clusters_by_name is None:
+            response = self._make_request('/clusters/list', 'GET')
+            if response is None or isinstance(response, _NotFound):
+                # Leave the cache empty so a later check can retry the listing
+                return {}
+            clusters_by_name: Dict[str, Dict] = {}
+            for cluster in response.get('clusters', []):
+                if 'cluster_name' in cluster:
+                    # Cluster names are not unique; keep the first match like a linear scan would
+                    clusters_by_name.setdefault(cluster['cluster_name'], cluster)
+            self._clusters_by_name = clusters_by_name
+        return self._clusters_by_name
+    
+    def _check_cluster(self, cluster_name: str) -> Tuple[bool, Dict, List[str]]:
+        """
+        Check that cluster configuration exists without recording the result
         
-        return True
+        Args:
+            cluster_name: Name of the cluster
+            
+        Returns:
+            Tuple of (cluster exists, validation result, console lines)
+        """
+        output = [f"\n⚙️  Validating cluster: {cluster_name}..."]
+        
+        clusters = self._get_clusters_by_name()
+        cluster = clusters.get(cluster_name)
+        
+        if cluster is not None:
+            output.append(f"  ✅ Cluster {cluster_name} found (state: {cluster.get('state')})")
+            return True, {
+                'component': f'cluster-{cluster_name}',
+                'status': 'PASSED',
+                'message': f'Cluster {cluster_name} found',
+                'cluster_state': cluster.get('state')
+            }, output
+        
+        output.append(f"  ⚠️  Cluster {cluster_name} not found")
+        return False, {
+            'component': f'cluster-{cluster_name}',
+            'status': 'WARNING',
+            'message': f'Cluster {cluster_name} not found'
+        }, output
     
     def validate_cluster(self, cluster_name: str) -> bool:
         """
@@ -225,29 +528,7 @@ class DeploymentValidator:
         Returns:
             True if cluster exists
         """
-        print(f"\n⚙️  Validating cluster: {cluster_name}...")
-        
-        response = self._make_request('/clusters/list', 'GET')
-        
-        if response and 'clusters' in response:
-            for cluster in response['clusters']:
-                if cluster.get('cluster_name') == cluster_name:
-                    self.validation_results.append({
-                        'component': f'cluster-{cluster_name}',
-                        'status': 'PASSED',
-                        'message': f'Cluster {cluster_name} found',
-                        'cluster_state': cluster.get('state')
-                    })
-                    print(f"  ✅ Cluster {cluster_name} found (state: {cluster.get('state')})")
-                    return True
-        
-        self.validation_results.append({
-            'component': f'cluster-{cluster_name}',
-            'status': 'WARNING',
-            'message': f'Cluster {cluster_name} not found'
-        })
-        print(f"  ⚠️  Cluster {cluster_name} not found")
-        return False
+        return self._record(*self._check_cluster(cluster_name))
     
     def run_smoke_test(self) -> bool:
         """
@@ -259,12 +540,15 @@ class DeploymentValidator:
         print("\n🔥 Running smoke tests...")
         
         # Test workspace API connectivity - check bundle root
-        bundle_root = f"/Workspace/Deployments/{self.env}"
-        endpoint = f'/workspace/get-status?path={bundle_root}'
+        endpoint = f'/workspace/get-status?path={self.bundle_root}'
         response = self._make_request(endpoint, 'GET')
         if response:
-            print(f"  ✅ Workspace API connectivity verified - bundle root exists at {bundle_root}")
+            print(f"  ✅ Workspace API connectivity verified - bundle root exists at {self.bundle_root}")
             return True
+        elif isinstance(response, _NotFound):
+            # The API answered, so connectivity is fine; the bundle has not been deployed
+            print(f"  ❌ Workspace API reachable but bundle root not found at {self.bundle_root}")
+            return False
         else:
             print("  ❌ Workspace API connectivity failed")
             return False
@@ -276,6 +560,9 @@ class DeploymentValidator:
         Returns:
             Validation report dictionary
         """
+        # Tally every status in a single pass over the results
+        counts = Counter(r['status'] for r in self.validation_results)
+        
         report = {
             'environment': self.env,
             'timestamp': datetime.now().isoformat(),
@@ -284,9 +571,9 @@ class DeploymentValidator:
             'validation_results': self.validation_results,
             'summary': {
                 'total_checks': len(self.validation_results),
-                'passed': len([r for r in self.validation_results if r['status'] == 'PASSED']),
-                'failed': len([r for r in self.validation_results if r['status'] == 'FAILED']),
-                'warnings': len([r for r in self.validation_results if r['status'] == 'WARNING'])
+                'passed': counts['PASSED'],
+                'failed': counts['FAILED'],
+                'warnings': counts['WARNING']
             }
         }
         
@@ -323,67 +610,71 @@ def main():
     # Initialize validator
     validator = DeploymentValidator(host, token, args.env)
     
-    print("=" * 50)
-    print(f"🔍 Databricks Deployment Validation")
-    print(f"   Environment: {args.env}")
-    print(f"   Workspace: {host}")
-    print(f"   Bundle Path: /Workspace/Deployments/{args.env}/files/src")
-    print(f"   Validation Path: {validator.base_path}")
-    print("=" * 50)
-    
-    # Run validations
-    all_passed = True
-    
-    # Run smoke test if requested
-    if args.smoke_test:
-        if not validator.run_smoke_test():
-            all_passed = False
-    
-    # For validate-all, discover and validate all folders
-    if args.validate_all:
-        import os
-        src_path = os.path.join(os.getcwd(), 'src')
-        if os.path.exists(src_path):
-            folders = [f for f in os.listdir(src_path) if os.path.isdir(os.path.join(src_path, f))]
-            print(f"Found folders to validate: {folders}")
-            for folder in sorted(folders):
-                if not validator.validate_folder(folder):
-                    all_passed = False
-        else:
-            print("Warning: src directory not found locally, validating known folders")
-            # Fallback to known folders
-            if not validator.validate_folder('shared'):
-                all_passed = False
-            if not validator.validate_use_case('usecase-1'):
+    try:
+        print("=" * 50)
+        print(f"🔍 Databricks Deployment Validation")
+        print(f"   Environment: {args.env}")
+        print(f"   Workspace: {host}")
+        print(f"   Bundle Path: {validator.base_path}")
+        print(f"   Validation Path: {validator.base_path}")
+        print("=" * 50)
+        
+        # Run validations
+        all_passed = True
+        
+        # Run smoke test if requested
+        if args.smoke_test:
+            if not validator.run_smoke_test():
                 all_passed = False
-            if not validator.validate_use_case('usecase-2'):
-                all_passed = False
-    elif args.use_case == 'all':
-        # Validate all known folders
-        if not validator.validate_folder('shared'):
-            all_passed = False
-        if not validator.validate_use_case('usecase-1'):
-            all_passed = False
-        if not validator.validate_use_case('usecase-2'):
-            all_passed = False
-    elif args.use_case:
-        # Always validate shared folder
-        if not validator.validate_folder('shared'):
-            all_passed = False
-        # Validate specific use case
-        if not validator.validate_use_case(args.use_case):
-            all_passed = False
-    else:
-        # Default: validate shared folder at minimum
-        if not validator.validate_folder('shared'):
-            all_passed = False
-    
-    # Validate cluster
-    cluster_name = f"{args.env}-cluster"
-    validator.validate_cluster(cluster_name)
-    
-    # Generate report
-    report = validator.generate_report()
+        
+        # Collect the folder checks to run; they are independent so they run concurrently
+        checks = []
+        
+        # For validate-all, discover and validate all folders
+        if args.validate_all:
+            import os
+            src_path = os.path.join(os.getcwd(), 'src')
+            if os.path.exists(src_path):
+                folders = [f for f in os.listdir(src_path) if os.path.isdir(os.path.join(src_path, f))]
+                print(f"Found folders to validate: {folders}")
+                for folder in sorted(folders):
+                    checks.append((validator._check_folder, folder))
+            else:
+                print("Warning: src directory not found locally, validating known folders")
+                # Fallback to known folders
+                checks.append((validator._check_folder, 'shared'))
+                checks.append((validator._check_use_case, 'usecase-1'))
+                checks.append((validator._check_use_case, 'usecase-2'))
+        elif args.use_case == 'all':
+            # Validate all known folders
+            checks.append((validator._check_folder, 'shared'))
+            checks.append((validator._check_use_case, 'usecase-1'))
+            checks.append((validator._check_use_case, 'usecase-2'))
+        elif args.use_case:
+            # Always validate shared folder
+            checks.append((validator._check_folder, 'shared'))
+            # Validate specific use case
+            checks.append((validator._check_use_case, args.use_case))
+        else:
+            # Default: validate shared folder at minimum
+            checks.append((validator._check_folder, 'shared'))
+        
+        cluster_name = f"{args.env}-cluster"
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(check, name) for check, name in checks]
+            # Validate cluster alongside the folders; a missing cluster is only a warning
+            cluster_future = executor.submit(validator._check_cluster, cluster_name)
+            # Record in submission order so the report and console output are stable across runs
+            for future in futures:
+                if not validator._record(*future.result()):
+                    all_passed = False
+            validator._record(*cluster_future.result())
+        
+        # Generate report
+        report = validator.generate_report()
+    finally:
+        validator.close()
     
     print("\n" + "=" * 50)
     print("📊 Validation Summary")
@@ -395,8 +686,8 @@ def main():
     
     # Save report if requested
     if args.output_json:
-        with open(args.output_json, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(args.output_json, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
         print(f"\n📄 Report saved to: {args.output_json}")
     
     # Exit with appropriate code